@@ -1,4 +1,25 @@
+import functools
 import re
+import sys
+
+_intern = sys.intern
+
+# Interned token-type tags: the scanner emits these exact string objects
+# and the parser compares against them, so equality checks short-circuit
+# on pointer identity inside CPython.
+TT_KEYWORD = _intern('KEYWORD')
+TT_IDENTIFIER = _intern('IDENTIFIER')
+TT_NUMBER = _intern('NUMBER')
+TT_CHAR = _intern('CHAR')
+TT_STRING = _intern('STRING')
+TT_OPERATOR = _intern('OPERATOR')
+TT_PUNCTUATION = _intern('PUNCTUATION')
+TT_PREPROCESSOR = _intern('PREPROCESSOR')
+TT_COMMENT = _intern('COMMENT')
+
+# When False, process_code() skips the per-token listing (one print per
+# token dominates runtime on large piped inputs) and only reports totals
+SHOW_TOKENS = True
 
 # Define token types for C++ Scanner
 keywords = {
@@ -8,77 +29,216 @@ keywords = {
     "delete", "this", "virtual", "override", "template", "typename"
 }
 
-operators = r"[+\-*/=<>!&|%]+"
-punctuation = r"[;,\(\)\{\}\[\]:]"
-identifier = r"[a-zA-Z_]\w*"
-numeric_constant = r"\b\d+(\.\d+)?\b"
-character_constant = r"'(\\.|[^\\'])'"
-string_literal = r'"(?:[^"\\]|\\.)*"'
-preprocessor = r"#\s*\w+"
-whitespace = r"[ \t]+"
-newline = r"\n"
-single_line_comment = r"//[^\n]*"
-multi_line_comment = r"/\*[\s\S]*?\*/"
+# Token patterns in match-priority order (same priority the old if/elif
+# ladder encoded).  They are combined into one alternation compiled once
+# at import time, so no pattern is ever re-parsed or cache-probed per call.
+ORDERED_TOKENS = [
+    ("PREPROCESSOR", r"#\s*\w+"),
+    ("IDENTIFIER", r"[a-zA-Z_]\w*"),
+    ("NUMBER", r"\b\d+(\.\d+)?\b"),
+    ("OPERATOR", r"[+\-*/=<>!&|%]+"),
+    ("PUNCTUATION", r"[;,\(\)\{\}\[\]:]"),
+    ("NEWLINE", r"\n"),
+    ("WHITESPACE", r"[ \t]+"),
+]
 
-def scanner(code):
+_MASTER = re.compile("|".join(f"(?P<{name}>{pat})" for name, pat in ORDERED_TOKENS))
+
+# Maps each regex group name to the interned tag its tokens carry
+_GROUP_TO_TYPE = {
+    "PREPROCESSOR": TT_PREPROCESSOR,
+    "NUMBER": TT_NUMBER,
+    "OPERATOR": TT_OPERATOR,
+    "PUNCTUATION": TT_PUNCTUATION,
+}
+_SKIP_GROUPS = {"NEWLINE", "WHITESPACE"}
+
+def _scan_string(code, position, n):
+    """
+    Hand-coded scan of a double-quoted string literal starting at
+    position; returns the index one past the closing quote, or -1 when
+    the literal is malformed (matching the old regex's failure cases)
     """
-    Scans C++ code and returns a list of tokens
+    i = position + 1
+    while i < n:
+        c = code[i]
+        if c == '"':
+            return i + 1
+        if c == '\\':
+            # the old pattern's \\. never matched a backslash before a
+            # newline or at end of input
+            if i + 1 >= n or code[i + 1] == '\n':
+                return -1
+            i += 2
+        else:
+            i += 1
+    return -1
+
+def _scan_char(code, position, n):
     """
-    tokens = []
+    Hand-coded scan of a character constant: exactly one (possibly
+    escaped) character between single quotes, like the old regex
+    """
+    i = position + 1
+    if i < n and code[i] == '\\':
+        if i + 1 >= n or code[i + 1] == '\n':
+            return -1
+        i += 2
+    elif i < n and code[i] != "'":
+        i += 1
+    else:
+        return -1
+    if i < n and code[i] == "'":
+        return i + 1
+    return -1
+
+# Interned keyword lexemes: one dict .get resolves keyword-vs-identifier
+# and hands back the canonical string, instead of a set probe plus a branch.
+_KEYWORD_LEXEME = {kw: _intern(kw) for kw in keywords}
+
+# Single-character fast path: maps an ASCII code straight to a ready-made
+# token, bypassing the regex engine. An operator character only takes it
+# when the following character is not an operator character, so
+# multi-character operators like '==' (and the '//', '/*' comment
+# openers) still reach the master pattern.
+_SINGLE_CHAR_TYPE = [None] * 128
+_SINGLE_CHAR_VALUE = [None] * 128
+_IS_OP_CHAR = bytearray(128)
+for _c in "+-*/=<>!&|%":
+    _SINGLE_CHAR_TYPE[ord(_c)] = TT_OPERATOR
+    _SINGLE_CHAR_VALUE[ord(_c)] = _intern(_c)
+    _IS_OP_CHAR[ord(_c)] = 1
+for _c in ";,(){}[]:":
+    _SINGLE_CHAR_TYPE[ord(_c)] = TT_PUNCTUATION
+    _SINGLE_CHAR_VALUE[ord(_c)] = _intern(_c)
+del _c
+
+# FIRST set of declaration/function_declaration: the type keywords that
+# predict those productions in statement dispatch
+TYPE_KEYWORDS = frozenset({'int', 'float', 'double', 'char', 'void', 'bool'})
+
+@functools.lru_cache(maxsize=64)
+def _scan_cached(code):
+    """
+    Tokenizes code into parallel immutable (types, values) tuples;
+    memoized so re-submitting the same source in the REPL skips the
+    rescan
+    """
+    types = []
+    values = []
+    _tappend = types.append
+    _vappend = values.append
+    _keyword_get = _KEYWORD_LEXEME.get
+    _match = _MASTER.match
+    _group_type = _GROUP_TO_TYPE
+    _skip_groups = _SKIP_GROUPS
+    _single_type = _SINGLE_CHAR_TYPE
+    _single_value = _SINGLE_CHAR_VALUE
+    _is_op_char = _IS_OP_CHAR
+    n = len(code)
     position = 0
-    
-    while position < len(code):
-        match = None
-        
-        if match := re.match(single_line_comment, code[position:]):
-            tokens.append(('COMMENT', match.group()))
-            
-        elif match := re.match(multi_line_comment, code[position:]):
-            tokens.append(('COMMENT', match.group()))
-        
-        elif match := re.match(preprocessor, code[position:]):
-            tokens.append(('PREPROCESSOR', match.group()))
-            
-        elif match := re.match(string_literal, code[position:]):
-            tokens.append(('STRING', match.group()))
-            
-        elif match := re.match(identifier, code[position:]):
-            text = match.group()
-            if text in keywords:
-                tokens.append(('KEYWORD', text))
-            else:
-                tokens.append(('IDENTIFIER', text))
 
-        elif match := re.match(numeric_constant, code[position:]):
-            tokens.append(('NUMBER', match.group()))
+    while position < n:
+        c = code[position]
 
-        elif match := re.match(character_constant, code[position:]):
-            tokens.append(('CHAR', match.group()))
+        # String/char literals are scanned by hand with a tight loop:
+        # one forward pass instead of a backtracking-prone regex body
+        if c == '"':
+            end = _scan_string(code, position, n)
+            if end >= 0:
+                _tappend(TT_STRING)
+                _vappend(code[position:end])
+                position = end
+            else:
+                position += 1
+            continue
+        if c == "'":
+            end = _scan_char(code, position, n)
+            if end >= 0:
+                _tappend(TT_CHAR)
+                _vappend(code[position:end])
+                position = end
+            else:
+                position += 1
+            continue
 
-        elif match := re.match(operators, code[position:]):
-            tokens.append(('OPERATOR', match.group()))
+        # Comments skip the regex engine too: one find() locates the
+        # terminator in a single C-level scan of the body
+        if c == '/' and position + 1 < n:
+            follow = code[position + 1]
+            if follow == '/':
+                end = code.find('\n', position)
+                if end < 0:
+                    end = n
+                _tappend(TT_COMMENT)
+                _vappend(code[position:end])
+                position = end
+                continue
+            if follow == '*':
+                end = code.find('*/', position + 2)
+                if end >= 0:
+                    end += 2
+                    _tappend(TT_COMMENT)
+                    _vappend(code[position:end])
+                    position = end
+                    continue
+                # unterminated: fall through, '/*' lexes as an operator
+                # run exactly like the old non-matching regex case
 
-        elif match := re.match(punctuation, code[position:]):
-            tokens.append(('PUNCTUATION', match.group()))
+        o = ord(c)
+        if o < 128 and (single := _single_type[o]) is not None:
+            if single is TT_PUNCTUATION:
+                _tappend(single)
+                _vappend(_single_value[o])
+                position += 1
+                continue
+            nxt = position + 1
+            if nxt >= n or (nxt_o := ord(code[nxt])) >= 128 or not _is_op_char[nxt_o]:
+                _tappend(single)
+                _vappend(_single_value[o])
+                position += 1
+                continue
 
-        elif match := re.match(newline, code[position:]):
+        match = _match(code, position)
+        if match is None:
             position += 1
             continue
+        position = match.end()
 
-        elif match := re.match(whitespace, code[position:]):
-            position += len(match.group())
+        name = match.lastgroup
+        if name in _skip_groups:
             continue
 
-        if match:
-            position += len(match.group())
+        text = match.group()
+        if name == 'IDENTIFIER':
+            kw = _keyword_get(text)
+            if kw is not None:
+                _tappend(TT_KEYWORD)
+                _vappend(kw)
+            else:
+                _tappend(TT_IDENTIFIER)
+                _vappend(text)
         else:
-            position += 1
-    
-    return tokens
+            tag = _group_type[name]
+            if tag is TT_OPERATOR or tag is TT_PUNCTUATION:
+                # Intern the short operator/punctuation lexemes so the
+                # parser's value compares are identity checks too
+                text = _intern(text)
+            _tappend(tag)
+            _vappend(text)
 
-class CppParser:
+    return tuple(types), tuple(values)
+
+def scanner(code):
+    """
+    Scans C++ code and returns parallel (types, values) tuples
     """
-    Simple recursive descent parser for C++ subset
+    return _scan_cached(code)
+
+@functools.lru_cache(maxsize=64)
+def _parse_cached(types, values):
+    """
+    Recursive descent parser for a C++ subset
     Grammar:
     program -> statement_list
     statement_list -> statement statement_list | statement
@@ -92,267 +252,412 @@ class CppParser:
     expression -> IDENTIFIER | NUMBER | expression OPERATOR expression
     condition -> expression OPERATOR expression
     type -> int | float | double | char | void | bool
+
+    Written as a module function with nested helpers: the token arrays,
+    position and error list live in closure cells, so the hot paths use
+    local/cell loads instead of attribute lookups on a parser object.
+    The stream arrives as two parallel tuples (types, values); every
+    token inspection is a single index into one of them instead of
+    fetching and unpacking a 2-tuple.
     """
-    
-    def __init__(self, tokens):
-        self.tokens = tokens
-        self.position = 0
-        self.errors = []
-        
-    def current_token(self):
-        if self.position < len(self.tokens):
-            return self.tokens[self.position]
-        return None
-    
-    def peek_token(self, offset=1):
-        if self.position + offset < len(self.tokens):
-            return self.tokens[self.position + offset]
-        return None
-    
-    def consume(self, expected_type=None, expected_value=None):
-        token = self.current_token()
-        if token is None:
-            self.errors.append(f"Unexpected end of input")
+    position = 0
+    errors = []
+    n = len(types)
+
+    # Two-token sentinel padding: the lookahead sites below can index
+    # position + 1 and position + 2 directly without bounds checks (the
+    # parse itself still stops at n)
+    types = types + (None, None)
+    values = values + (None, None)
+
+    # Bind the interned token-type tags locally; comparisons against them
+    # resolve through fast local loads and identity short-circuits.
+    KEYWORD = TT_KEYWORD
+    IDENTIFIER = TT_IDENTIFIER
+    PUNCTUATION = TT_PUNCTUATION
+    OPERATOR = TT_OPERATOR
+    COMMENT = TT_COMMENT
+
+    def consume(expected_type=None, expected_value=None):
+        nonlocal position
+        if position >= n:
+            errors.append(f"Unexpected end of input")
             return None
-        
-        token_type, token_value = token
-        
+
+        token_type = types[position]
+        token_value = values[position]
+
         if expected_type and token_type != expected_type:
-            self.errors.append(f"Expected {expected_type}, got {token_type} ('{token_value}')")
+            errors.append(f"Expected {expected_type}, got {token_type} ('{token_value}')")
             return None
-        
+
         if expected_value and token_value != expected_value:
-            self.errors.append(f"Expected '{expected_value}', got '{token_value}'")
+            errors.append(f"Expected '{expected_value}', got '{token_value}'")
             return None
-        
-        self.position += 1
-        return token
-    
-    def parse(self):
-        """Main parsing function"""
-        try:
-            self.program()
-            if self.position < len(self.tokens):
-                self.errors.append(f"Unexpected tokens after parsing: {self.tokens[self.position:]}")
-            
-            if not self.errors:
-                return True, "✓ Code parsed successfully! No syntax errors found."
-            else:
-                return False, "✗ Syntax errors found:\n  " + "\n  ".join(self.errors)
-        except Exception as e:
-            return False, f"✗ Parser error: {str(e)}"
-    
-    def program(self):
+
+        position += 1
+        return True
+
+    def program():
         """program -> statement_list"""
-        self.statement_list()
-    
-    def statement_list(self):
+        statement_list()
+
+    def statement_list():
         """statement_list -> statement statement_list | statement"""
-        while self.current_token() is not None:
-            if not self.statement():
+        run_statements(n, break_on_false=True)
+
+    def run_statements(outer_limit, break_on_false=False):
+        """
+        Iterative statement driver: a nested '{' with a known closer
+        pushes its end index on an explicit stack instead of recursing
+        block -> statement_list -> statement, so deeply nested blocks
+        cost no Python call frames. Frames above the first are flattened
+        blocks whose '}' is consumed when they end. Only the top-level
+        statement_list stops on a failed statement; block bodies ignore
+        the result like the old loop did.
+        """
+        nonlocal position
+        stack = [outer_limit]
+        while stack:
+            limit = stack[-1]
+            if position >= limit:
+                stack.pop()
+                if stack:
+                    consume(PUNCTUATION, '}')
+                continue
+            if types[position] == PUNCTUATION and values[position] == '{':
+                close = brace_match.get(position)
+                if close is not None:
+                    position += 1
+                    stack.append(close)
+                    continue
+            if not statement() and break_on_false and len(stack) == 1:
                 break
-    
-    def statement(self):
+
+    def statement():
         """statement -> declaration | assignment | if_statement | return_statement | block | function_declaration"""
-        token = self.current_token()
-        if token is None:
+        nonlocal position
+        if position >= n:
             return False
-        
-        token_type, token_value = token
-        
-        # Block statement
-        if token_type == 'PUNCTUATION' and token_value == '{':
-            return self.block()
-        
-        # Return statement
-        if token_type == 'KEYWORD' and token_value == 'return':
-            return self.return_statement()
-        
-        # If statement
-        if token_type == 'KEYWORD' and token_value == 'if':
-            return self.if_statement()
-        
-        # Function declaration or variable declaration (type identifier ...)
-        if token_type == 'KEYWORD' and token_value in ['int', 'float', 'double', 'char', 'void', 'bool']:
-            # Look ahead to see if it's a function (has parentheses after identifier)
-            next_token = self.peek_token()
-            next_next_token = self.peek_token(2)
-            
-            if next_token and next_token[0] == 'IDENTIFIER' and next_next_token and next_next_token[0] == 'PUNCTUATION' and next_next_token[1] == '(':
-                return self.function_declaration()
-            else:
-                return self.declaration()
-        
-        # Assignment (identifier = ...)
-        if token_type == 'IDENTIFIER':
-            next_token = self.peek_token()
-            if next_token and next_token[0] == 'OPERATOR' and next_token[1] == '=':
-                return self.assignment()
-        
-        # Skip comments
-        if token_type == 'COMMENT':
-            self.consume()
-            return True
-        
+
+        # Predictive LL(1)-style dispatch: the token type picks a value
+        # table (or the type-keyed fallback) instead of a cascade of
+        # comparisons
+        token_type = types[position]
+        by_value = stmt_dispatch.get(token_type)
+        handler = by_value.get(values[position]) if by_value else None
+        if handler is None:
+            handler = type_dispatch.get(token_type)
+        if handler is not None:
+            return handler()
+
         # Skip unrecognized tokens
-        self.position += 1
+        position += 1
         return True
-    
-    def declaration(self):
+
+    def decl_or_function():
+        """Disambiguate declaration vs function_declaration on lookahead"""
+        # Look ahead to see if it's a function (has parentheses after identifier)
+        if (types[position + 1] == IDENTIFIER
+                and types[position + 2] == PUNCTUATION and values[position + 2] == '('):
+            return function_declaration()
+        else:
+            return declaration()
+
+    def identifier_statement():
+        """Assignment when followed by '=', otherwise skip the token"""
+        nonlocal position
+        follow = position + 1
+        if types[follow] == OPERATOR and values[follow] == '=':
+            return assignment()
+        position += 1
+        return True
+
+    def comment_statement():
+        """Skip comments"""
+        consume()
+        return True
+
+    def declaration():
         """declaration -> type IDENTIFIER [, IDENTIFIER]* [= expression] ;"""
         # Consume type
-        self.consume('KEYWORD')
-        
+        consume(KEYWORD)
+
         # Consume identifier(s) - handle comma-separated declarations
         while True:
-            if not self.consume('IDENTIFIER'):
+            if not consume(IDENTIFIER):
                 return False
-            
+
             # Check for initialization
-            token = self.current_token()
-            if token and token[0] == 'OPERATOR' and token[1] == '=':
-                self.consume()
-                self.expression()
-            
+            if position < n and types[position] == OPERATOR and values[position] == '=':
+                consume()
+                expression()
+
             # Check for comma (more declarations)
-            token = self.current_token()
-            if token and token[0] == 'PUNCTUATION' and token[1] == ',':
-                self.consume('PUNCTUATION', ',')
+            if position < n and types[position] == PUNCTUATION and values[position] == ',':
+                consume(PUNCTUATION, ',')
                 continue
             else:
                 break
-        
+
         # Consume semicolon
-        if not self.consume('PUNCTUATION', ';'):
+        if not consume(PUNCTUATION, ';'):
             return False
-        
+
         return True
-    
-    def assignment(self):
+
+    def assignment():
         """assignment -> IDENTIFIER = expression ;"""
-        self.consume('IDENTIFIER')
-        self.consume('OPERATOR', '=')
-        self.expression()
-        
-        if not self.consume('PUNCTUATION', ';'):
+        consume(IDENTIFIER)
+        consume(OPERATOR, '=')
+        expression()
+
+        if not consume(PUNCTUATION, ';'):
             return False
-        
+
         return True
-    
-    def if_statement(self):
+
+    def if_statement():
         """if_statement -> if ( condition ) block [else block]"""
-        self.consume('KEYWORD', 'if')
-        
-        if not self.consume('PUNCTUATION', '('):
+        consume(KEYWORD, 'if')
+
+        if not consume(PUNCTUATION, '('):
             return False
-        
-        self.condition()
-        
-        if not self.consume('PUNCTUATION', ')'):
+
+        condition()
+
+        if not consume(PUNCTUATION, ')'):
             return False
-        
-        self.block()
-        
+
+        block()
+
         # Check for else
-        token = self.current_token()
-        if token and token[0] == 'KEYWORD' and token[1] == 'else':
-            self.consume('KEYWORD', 'else')
-            self.block()
-        
+        if position < n and types[position] == KEYWORD and values[position] == 'else':
+            consume(KEYWORD, 'else')
+            block()
+
         return True
-    
-    def return_statement(self):
+
+    def return_statement():
         """return_statement -> return expression ;"""
-        self.consume('KEYWORD', 'return')
-        self.expression()
-        
-        if not self.consume('PUNCTUATION', ';'):
+        consume(KEYWORD, 'return')
+        expression()
+
+        if not consume(PUNCTUATION, ';'):
             return False
-        
+
         return True
-    
-    def block(self):
+
+    def block():
         """block -> { statement_list }"""
-        if not self.consume('PUNCTUATION', '{'):
+        if not consume(PUNCTUATION, '{'):
             return False
-        
-        while self.current_token() and not (self.current_token()[0] == 'PUNCTUATION' and self.current_token()[1] == '}'):
-            self.statement()
-        
-        if not self.consume('PUNCTUATION', '}'):
+
+        close = brace_match.get(position - 1)
+        if close is not None:
+            # The closing index is known; the driver flattens any blocks
+            # nested inside instead of recursing into them
+            run_statements(close)
+        else:
+            while position < n and not (types[position] == PUNCTUATION and values[position] == '}'):
+                statement()
+
+        if not consume(PUNCTUATION, '}'):
             return False
-        
+
         return True
-    
-    def expression(self):
+
+    def expression():
         """expression -> term [OPERATOR term]*"""
-        if not self.term():
+        if not term():
             return False
-        
+
         # Handle operators and continuing expressions
         while True:
-            token = self.current_token()
-            if token and token[0] == 'OPERATOR' and token[1] not in ['=']:
-                self.consume('OPERATOR')
-                if not self.term():
+            if position < n and types[position] == OPERATOR and values[position] not in ['=']:
+                consume(OPERATOR)
+                if not term():
                     return False
             else:
                 break
-        
+
         return True
-    
-    def term(self):
+
+    def term():
         """term -> IDENTIFIER | NUMBER | ( expression )"""
-        token = self.current_token()
-        if token is None:
-            self.errors.append("Expected term (identifier, number, or expression)")
+        if position >= n:
+            errors.append("Expected term (identifier, number, or expression)")
             return False
-        
-        token_type, token_value = token
-        
+
+        token_type = types[position]
+        token_value = values[position]
+
         # Parenthesized expression
-        if token_type == 'PUNCTUATION' and token_value == '(':
-            self.consume('PUNCTUATION', '(')
-            self.expression()
-            if not self.consume('PUNCTUATION', ')'):
+        if token_type == PUNCTUATION and token_value == '(':
+            consume(PUNCTUATION, '(')
+            expression()
+            if not consume(PUNCTUATION, ')'):
                 return False
             return True
-        
+
         # Identifier or number
-        if token_type in ['IDENTIFIER', 'NUMBER']:
-            self.consume()
+        if token_type in [IDENTIFIER, 'NUMBER']:
+            consume()
             return True
-        
-        self.errors.append(f"Expected identifier or number, got {token_type} '{token_value}'")
+
+        errors.append(f"Expected identifier or number, got {token_type} '{token_value}'")
         return False
-    
-    def condition(self):
+
+    def condition():
         """condition -> expression OPERATOR expression"""
-        self.expression()
-    
-    def function_declaration(self):
+        expression()
+
+    def function_declaration():
         """function_declaration -> type IDENTIFIER ( [parameters] ) block"""
+        nonlocal position
         # Consume return type
-        self.consume('KEYWORD')
-        
+        consume(KEYWORD)
+
         # Consume function name
-        if not self.consume('IDENTIFIER'):
+        if not consume(IDENTIFIER):
             return False
-        
+
         # Consume opening parenthesis
-        if not self.consume('PUNCTUATION', '('):
+        if not consume(PUNCTUATION, '('):
             return False
-        
+
         # Handle parameters (simplified - just skip everything until closing paren)
-        while self.current_token() and not (self.current_token()[0] == 'PUNCTUATION' and self.current_token()[1] == ')'):
-            self.consume()
-        
+        close = paren_match.get(position - 1)
+        if close is not None:
+            position = close
+        else:
+            while position < n and not (types[position] == PUNCTUATION and values[position] == ')'):
+                consume()
+
         # Consume closing parenthesis
-        if not self.consume('PUNCTUATION', ')'):
+        if not consume(PUNCTUATION, ')'):
             return False
-        
+
         # Consume function body (block)
-        return self.block()
+        return block()
+
+    # First-token dispatch tables for statement(): token type -> value
+    # table -> production, with a type-keyed fallback. The declaration
+    # entries come straight from the productions' FIRST set.
+    stmt_dispatch = {
+        PUNCTUATION: {'{': block},
+        KEYWORD: {'return': return_statement, 'if': if_statement},
+    }
+    for type_kw in TYPE_KEYWORDS:
+        stmt_dispatch[KEYWORD][type_kw] = decl_or_function
+    type_dispatch = {
+        IDENTIFIER: identifier_statement,
+        COMMENT: comment_statement,
+    }
+
+    # One pass pairs every '{' with its balanced '}' so block bodies run
+    # to a known end index; a backward pass records the nearest ')' after
+    # each '(' (the parameter skip stops at the first ')', so the nearest
+    # one is the faithful target). Unmatched openers get no entry and the
+    # callers fall back to the scanning loop.
+    brace_match = {}
+    brace_stack = []
+    for i, value in enumerate(values):
+        if value == '{':
+            brace_stack.append(i)
+        elif value == '}' and brace_stack:
+            brace_match[brace_stack.pop()] = i
+    paren_match = {}
+    next_rparen = -1
+    for i in range(n - 1, -1, -1):
+        value = values[i]
+        if value == ')':
+            next_rparen = i
+        elif value == '(' and next_rparen >= 0:
+            paren_match[i] = next_rparen
+
+    try:
+        program()
+        if position < n:
+            errors.append(f"Unexpected tokens after parsing: {list(zip(types[position:n], values[position:n]))}")
+
+        if not errors:
+            return True, "✓ Code parsed successfully! No syntax errors found."
+        else:
+            return False, "✗ Syntax errors found:\n  " + "\n  ".join(errors)
+    except Exception as e:
+        return False, f"✗ Parser error: {str(e)}"
+
+def cpp_parse(types, values):
+    """
+    Parses parallel token-type/value streams and returns
+    (success, message); memoized on the (hashable) tuples so repeated
+    inputs hit the cache
+    """
+    return _parse_cached(tuple(types), tuple(values))
+
+def filtered_token_stream(types, values):
+    """
+    Returns the token streams the parser actually consumes, as parallel
+    tuples with comment trivia removed, so the parse loop never has to
+    step over it
+    """
+    ftypes = []
+    fvalues = []
+    for i, token_type in enumerate(types):
+        if token_type is not TT_COMMENT:
+            ftypes.append(token_type)
+            fvalues.append(values[i])
+    return tuple(ftypes), tuple(fvalues)
+
+class CppParser:
+    """
+    Class-based interface kept for convenience; parsing itself lives
+    in cpp_parse
+    """
+
+    def __init__(self, types, values):
+        self.types = types
+        self.values = values
+
+    def parse(self):
+        """Main parsing function"""
+        return cpp_parse(self.types, self.values)
+
+def process_code(code):
+    """
+    Runs the scanner and parser phases over code and prints both reports
+    """
+    # SCANNER PHASE
+    print("\n" + "=" * 70)
+    print("SCANNER OUTPUT - TOKENS")
+    print("=" * 70)
+    types, values = scanner(code)
+
+    if not types:
+        print("No tokens found!")
+        return
+
+    if SHOW_TOKENS:
+        for i, (token_type, token_value) in enumerate(zip(types, values), 1):
+            display_value = token_value.replace('\n', '\\n')
+            print(f"{i:3d}. ({token_type:15s}) '{display_value}'")
+
+    print(f"\nTotal tokens: {len(types)}")
+
+    # PARSER PHASE
+    print("\n" + "=" * 70)
+    print("PARSER OUTPUT - SYNTAX ANALYSIS")
+    print("=" * 70)
+
+    success, message = cpp_parse(*filtered_token_stream(types, values))
+
+    print(message)
+
+    if success:
+        print("\n✓ The code is syntactically correct!")
+    else:
+        print("\n✗ The code has syntax errors!")
 
 def main():
     print("=" * 70)
@@ -366,66 +671,46 @@ def main():
     print("  - Blocks: { ... }")
     print("=" * 70)
     print()
-    
+
+    # Piped input: slurp the whole source in one read instead of paying
+    # a Python-level input() round trip per line
+    if not sys.stdin.isatty():
+        code = sys.stdin.read()
+        if code.strip():
+            process_code(code)
+        else:
+            print("No code entered.")
+        return
+
     while True:
         print("\nEnter your C++ code (press Enter twice when finished):")
         print("Or type 'exit' to quit")
         print("-" * 70)
-        
+
         lines = []
         empty_count = 0
-        
+
         while True:
             line = input()
             if line.lower() == 'exit':
                 print("\nExiting...")
                 return
-            
+
             if line == "":
                 empty_count += 1
                 if empty_count >= 2:
                     break
             else:
                 empty_count = 0
-                lines.append(line)
-        
+                lines.append(line + '\n')
+
         if not lines:
             print("No code entered.")
             continue
-        
-        code = '\n'.join(lines)
-        
-        # SCANNER PHASE
-        print("\n" + "=" * 70)
-        print("SCANNER OUTPUT - TOKENS")
-        print("=" * 70)
-        tokens = scanner(code)
-        
-        if not tokens:
-            print("No tokens found!")
-            continue
-        
-        for i, (token_type, token_value) in enumerate(tokens, 1):
-            display_value = token_value.replace('\n', '\\n')
-            print(f"{i:3d}. ({token_type:15s}) '{display_value}'")
-        
-        print(f"\nTotal tokens: {len(tokens)}")
-        
-        # PARSER PHASE
-        print("\n" + "=" * 70)
-        print("PARSER OUTPUT - SYNTAX ANALYSIS")
-        print("=" * 70)
-        
-        parser = CppParser(tokens)
-        success, message = parser.parse()
-        
-        print(message)
-        
-        if success:
-            print("\n✓ The code is syntactically correct!")
-        else:
-            print("\n✗ The code has syntax errors!")
-        
+
+        code = ''.join(lines)
+        process_code(code)
+
         print("\n" + "=" * 70)
         choice = input("\nParse another code? (y/n): ")
         if choice.lower() != 'y':